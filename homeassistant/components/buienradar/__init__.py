@@ -22,12 +22,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
-        for platform in PLATFORMS:
-            if (data := entry_data.get(platform)) and (
-                unsub := data.unsub_schedule_update
-            ):
-                unsub()
+        # The coordinators stop polling once their entities are removed.
+        hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
 
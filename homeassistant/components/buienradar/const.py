@@ -18,6 +18,9 @@ SCHEDULE_OK = 10
 SCHEDULE_NOK = 2
 """When an error occurred, new call after (minutes)."""
 
+MEASURED_LABEL = "Measured"
+STATIONNAME_LABEL = "Stationname"
+
 STATE_CONDITIONS = ["clear", "cloudy", "fog", "rainy", "snowy", "lightning"]
 
 STATE_DETAILED_CONDITIONS = [
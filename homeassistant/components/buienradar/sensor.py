@@ -2,21 +2,19 @@
 
 from __future__ import annotations
 
+from enum import IntEnum
 import logging
+import sys
+from typing import Any
 
 from buienradar.constants import (
-    ATTRIBUTION,
     CONDCODE,
     CONDITION,
     DETAILED,
     EXACT,
     EXACTNL,
-    FORECAST,
     IMAGE,
-    MEASURED,
     PRECIPITATION_FORECAST,
-    STATIONNAME,
-    TIMEFRAME,
     VISIBILITY,
     WINDGUST,
     WINDSPEED,
@@ -30,10 +28,8 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    ATTR_ATTRIBUTION,
     CONF_LATITUDE,
     CONF_LONGITUDE,
-    CONF_NAME,
     DEGREE,
     PERCENTAGE,
     Platform,
@@ -47,7 +43,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_TIMEFRAME,
@@ -57,20 +53,143 @@ from .const import (
     STATE_CONDITIONS,
     STATE_DETAILED_CONDITIONS,
 )
-from .util import BrData
+from .util import BrDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-MEASURED_LABEL = "Measured"
-TIMEFRAME_LABEL = "Timeframe"
 SYMBOL = "symbol"
 
-# Schedule next call after (minutes):
-SCHEDULE_OK = 10
-# When an error occurred, new call after (minutes):
-SCHEDULE_NOK = 2
-
-STATIONNAME_LABEL = "Stationname"
+# Map the `_Nd` forecast-day suffix of a sensor key to the forecast index.
+_FORECAST_DAYS = {"_1d": 0, "_2d": 1, "_3d": 2, "_4d": 3, "_5d": 4}
+
+
+class _SensorKind(IntEnum):
+    """Kind of value a sensor extracts, resolved once from its key."""
+
+    FORECAST_CONDITION = 0
+    FORECAST_WINDSPEED = 1
+    FORECAST = 2
+    CONDITION = 3
+    PRECIPITATION_FORECAST = 4
+    WINDSPEED = 5
+    VISIBILITY = 6
+    OTHER = 7
+
+
+# Map a condition sensor key to the condition field it exposes.
+_CONDITION_FIELDS = {
+    SYMBOL: EXACTNL,
+    CONDITION: CONDITION,
+    "conditioncode": CONDCODE,
+    "conditiondetailed": DETAILED,
+    "conditionexact": EXACT,
+}
+
+# Forecast (`_Nd`) sensor families: base key and the keyword arguments
+# shared by the five per-day descriptions of that family.
+_FORECAST_SENSOR_KWARGS: tuple[tuple[str, dict[str, Any]], ...] = (
+    (
+        "temperature",
+        {
+            "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
+            "device_class": SensorDeviceClass.TEMPERATURE,
+        },
+    ),
+    (
+        "mintemp",
+        {
+            "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
+            "device_class": SensorDeviceClass.TEMPERATURE,
+        },
+    ),
+    (
+        "rain",
+        {
+            "native_unit_of_measurement": UnitOfPrecipitationDepth.MILLIMETERS,
+            "device_class": SensorDeviceClass.PRECIPITATION,
+        },
+    ),
+    # new in json api (>1.0.0):
+    (
+        "minrain",
+        {
+            "native_unit_of_measurement": UnitOfPrecipitationDepth.MILLIMETERS,
+            "device_class": SensorDeviceClass.PRECIPITATION,
+        },
+    ),
+    # new in json api (>1.0.0):
+    (
+        "maxrain",
+        {
+            "native_unit_of_measurement": UnitOfPrecipitationDepth.MILLIMETERS,
+            "device_class": SensorDeviceClass.PRECIPITATION,
+        },
+    ),
+    (
+        "rainchance",
+        {
+            "native_unit_of_measurement": PERCENTAGE,
+            "icon": "mdi:weather-pouring",
+        },
+    ),
+    (
+        "sunchance",
+        {
+            "native_unit_of_measurement": PERCENTAGE,
+            "icon": "mdi:weather-partly-cloudy",
+        },
+    ),
+    (
+        "windforce",
+        {
+            "native_unit_of_measurement": "Bft",
+            "icon": "mdi:weather-windy",
+        },
+    ),
+    (
+        "windspeed",
+        {
+            "native_unit_of_measurement": UnitOfSpeed.KILOMETERS_PER_HOUR,
+            "device_class": SensorDeviceClass.WIND_SPEED,
+        },
+    ),
+    (
+        "winddirection",
+        {
+            "icon": "mdi:compass-outline",
+        },
+    ),
+    (
+        "windazimuth",
+        {
+            "native_unit_of_measurement": DEGREE,
+            "icon": "mdi:compass-outline",
+        },
+    ),
+    (
+        "condition",
+        {
+            "device_class": SensorDeviceClass.ENUM,
+            "options": STATE_CONDITIONS,
+        },
+    ),
+    (
+        "conditioncode",
+        {
+            "device_class": SensorDeviceClass.ENUM,
+            "options": STATE_CONDITION_CODES,
+        },
+    ),
+    (
+        "conditiondetailed",
+        {
+            "device_class": SensorDeviceClass.ENUM,
+            "options": STATE_DETAILED_CONDITIONS,
+        },
+    ),
+    ("conditionexact", {}),
+    ("symbol", {}),
+)
 
 SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
@@ -229,462 +348,16 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
         device_class=SensorDeviceClass.PRECIPITATION,
     ),
-    SensorEntityDescription(
-        key="temperature_1d",
-        translation_key="temperature_1d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="temperature_2d",
-        translation_key="temperature_2d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="temperature_3d",
-        translation_key="temperature_3d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="temperature_4d",
-        translation_key="temperature_4d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="temperature_5d",
-        translation_key="temperature_5d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="mintemp_1d",
-        translation_key="mintemp_1d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="mintemp_2d",
-        translation_key="mintemp_2d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="mintemp_3d",
-        translation_key="mintemp_3d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="mintemp_4d",
-        translation_key="mintemp_4d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="mintemp_5d",
-        translation_key="mintemp_5d",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    SensorEntityDescription(
-        key="rain_1d",
-        translation_key="rain_1d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="rain_2d",
-        translation_key="rain_2d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="rain_3d",
-        translation_key="rain_3d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="rain_4d",
-        translation_key="rain_4d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="rain_5d",
-        translation_key="rain_5d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    # new in json api (>1.0.0):
-    SensorEntityDescription(
-        key="minrain_1d",
-        translation_key="minrain_1d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="minrain_2d",
-        translation_key="minrain_2d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="minrain_3d",
-        translation_key="minrain_3d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="minrain_4d",
-        translation_key="minrain_4d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="minrain_5d",
-        translation_key="minrain_5d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    # new in json api (>1.0.0):
-    SensorEntityDescription(
-        key="maxrain_1d",
-        translation_key="maxrain_1d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="maxrain_2d",
-        translation_key="maxrain_2d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="maxrain_3d",
-        translation_key="maxrain_3d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="maxrain_4d",
-        translation_key="maxrain_4d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="maxrain_5d",
-        translation_key="maxrain_5d",
-        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
-        device_class=SensorDeviceClass.PRECIPITATION,
-    ),
-    SensorEntityDescription(
-        key="rainchance_1d",
-        translation_key="rainchance_1d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-pouring",
-    ),
-    SensorEntityDescription(
-        key="rainchance_2d",
-        translation_key="rainchance_2d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-pouring",
-    ),
-    SensorEntityDescription(
-        key="rainchance_3d",
-        translation_key="rainchance_3d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-pouring",
-    ),
-    SensorEntityDescription(
-        key="rainchance_4d",
-        translation_key="rainchance_4d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-pouring",
-    ),
-    SensorEntityDescription(
-        key="rainchance_5d",
-        translation_key="rainchance_5d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-pouring",
-    ),
-    SensorEntityDescription(
-        key="sunchance_1d",
-        translation_key="sunchance_1d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-partly-cloudy",
-    ),
-    SensorEntityDescription(
-        key="sunchance_2d",
-        translation_key="sunchance_2d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-partly-cloudy",
-    ),
-    SensorEntityDescription(
-        key="sunchance_3d",
-        translation_key="sunchance_3d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-partly-cloudy",
-    ),
-    SensorEntityDescription(
-        key="sunchance_4d",
-        translation_key="sunchance_4d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-partly-cloudy",
-    ),
-    SensorEntityDescription(
-        key="sunchance_5d",
-        translation_key="sunchance_5d",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:weather-partly-cloudy",
-    ),
-    SensorEntityDescription(
-        key="windforce_1d",
-        translation_key="windforce_1d",
-        native_unit_of_measurement="Bft",
-        icon="mdi:weather-windy",
-    ),
-    SensorEntityDescription(
-        key="windforce_2d",
-        translation_key="windforce_2d",
-        native_unit_of_measurement="Bft",
-        icon="mdi:weather-windy",
-    ),
-    SensorEntityDescription(
-        key="windforce_3d",
-        translation_key="windforce_3d",
-        native_unit_of_measurement="Bft",
-        icon="mdi:weather-windy",
-    ),
-    SensorEntityDescription(
-        key="windforce_4d",
-        translation_key="windforce_4d",
-        native_unit_of_measurement="Bft",
-        icon="mdi:weather-windy",
-    ),
-    SensorEntityDescription(
-        key="windforce_5d",
-        translation_key="windforce_5d",
-        native_unit_of_measurement="Bft",
-        icon="mdi:weather-windy",
-    ),
-    SensorEntityDescription(
-        key="windspeed_1d",
-        translation_key="windspeed_1d",
-        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-        device_class=SensorDeviceClass.WIND_SPEED,
-    ),
-    SensorEntityDescription(
-        key="windspeed_2d",
-        translation_key="windspeed_2d",
-        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-        device_class=SensorDeviceClass.WIND_SPEED,
-    ),
-    SensorEntityDescription(
-        key="windspeed_3d",
-        translation_key="windspeed_3d",
-        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-        device_class=SensorDeviceClass.WIND_SPEED,
-    ),
-    SensorEntityDescription(
-        key="windspeed_4d",
-        translation_key="windspeed_4d",
-        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-        device_class=SensorDeviceClass.WIND_SPEED,
-    ),
-    SensorEntityDescription(
-        key="windspeed_5d",
-        translation_key="windspeed_5d",
-        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-        device_class=SensorDeviceClass.WIND_SPEED,
-    ),
-    SensorEntityDescription(
-        key="winddirection_1d",
-        translation_key="winddirection_1d",
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="winddirection_2d",
-        translation_key="winddirection_2d",
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="winddirection_3d",
-        translation_key="winddirection_3d",
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="winddirection_4d",
-        translation_key="winddirection_4d",
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="winddirection_5d",
-        translation_key="winddirection_5d",
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="windazimuth_1d",
-        translation_key="windazimuth_1d",
-        native_unit_of_measurement=DEGREE,
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="windazimuth_2d",
-        translation_key="windazimuth_2d",
-        native_unit_of_measurement=DEGREE,
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="windazimuth_3d",
-        translation_key="windazimuth_3d",
-        native_unit_of_measurement=DEGREE,
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="windazimuth_4d",
-        translation_key="windazimuth_4d",
-        native_unit_of_measurement=DEGREE,
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="windazimuth_5d",
-        translation_key="windazimuth_5d",
-        native_unit_of_measurement=DEGREE,
-        icon="mdi:compass-outline",
-    ),
-    SensorEntityDescription(
-        key="condition_1d",
-        translation_key="condition_1d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="condition_2d",
-        translation_key="condition_2d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="condition_3d",
-        translation_key="condition_3d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="condition_4d",
-        translation_key="condition_4d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="condition_5d",
-        translation_key="condition_5d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="conditioncode_1d",
-        translation_key="conditioncode_1d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITION_CODES,
-    ),
-    SensorEntityDescription(
-        key="conditioncode_2d",
-        translation_key="conditioncode_2d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITION_CODES,
-    ),
-    SensorEntityDescription(
-        key="conditioncode_3d",
-        translation_key="conditioncode_3d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITION_CODES,
-    ),
-    SensorEntityDescription(
-        key="conditioncode_4d",
-        translation_key="conditioncode_4d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITION_CODES,
-    ),
-    SensorEntityDescription(
-        key="conditioncode_5d",
-        translation_key="conditioncode_5d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_CONDITION_CODES,
-    ),
-    SensorEntityDescription(
-        key="conditiondetailed_1d",
-        translation_key="conditiondetailed_1d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_DETAILED_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="conditiondetailed_2d",
-        translation_key="conditiondetailed_2d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_DETAILED_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="conditiondetailed_3d",
-        translation_key="conditiondetailed_3d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_DETAILED_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="conditiondetailed_4d",
-        translation_key="conditiondetailed_4d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_DETAILED_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="conditiondetailed_5d",
-        translation_key="conditiondetailed_5d",
-        device_class=SensorDeviceClass.ENUM,
-        options=STATE_DETAILED_CONDITIONS,
-    ),
-    SensorEntityDescription(
-        key="conditionexact_1d",
-        translation_key="conditionexact_1d",
-    ),
-    SensorEntityDescription(
-        key="conditionexact_2d",
-        translation_key="conditionexact_2d",
-    ),
-    SensorEntityDescription(
-        key="conditionexact_3d",
-        translation_key="conditionexact_3d",
-    ),
-    SensorEntityDescription(
-        key="conditionexact_4d",
-        translation_key="conditionexact_4d",
-    ),
-    SensorEntityDescription(
-        key="conditionexact_5d",
-        translation_key="conditionexact_5d",
-    ),
-    SensorEntityDescription(
-        key="symbol_1d",
-        translation_key="symbol_1d",
-    ),
-    SensorEntityDescription(
-        key="symbol_2d",
-        translation_key="symbol_2d",
-    ),
-    SensorEntityDescription(
-        key="symbol_3d",
-        translation_key="symbol_3d",
-    ),
-    SensorEntityDescription(
-        key="symbol_4d",
-        translation_key="symbol_4d",
-    ),
-    SensorEntityDescription(
-        key="symbol_5d",
-        translation_key="symbol_5d",
+    # Forecast (`_Nd`) variants are pure products of {base sensor x day};
+    # generate them instead of spelling out 80 near-identical literals.
+    *(
+        SensorEntityDescription(
+            key=(key := sys.intern(f"{base}_{day}d")),
+            translation_key=key,
+            **kwargs,
+        )
+        for base, kwargs in _FORECAST_SENSOR_KWARGS
+        for day in range(1, 6)
     ),
 )
 
@@ -715,191 +388,188 @@ async def async_setup_entry(
         timeframe,
     )
 
-    # create weather entities:
-    entities = [
-        BrSensor(config.get(CONF_NAME, "Buienradar"), coordinates, description)
-        for description in SENSOR_TYPES
-    ]
-
     # create weather data:
-    data = BrData(hass, coordinates, timeframe, entities)
-    hass.data[DOMAIN][entry.entry_id][Platform.SENSOR] = data
-    await data.async_update()
+    coordinator = BrDataUpdateCoordinator(hass, coordinates, timeframe)
+    hass.data[DOMAIN][entry.entry_id][Platform.SENSOR] = coordinator
+    await coordinator.async_refresh()
 
-    async_add_entities(entities)
+    # create weather entities:
+    # the lat/lon prefix of the unique id is identical for every entity,
+    # so format it only once:
+    coord_prefix = (
+        f"{coordinates[CONF_LATITUDE]:2.6f}{coordinates[CONF_LONGITUDE]:2.6f}"
+    )
+    async_add_entities(
+        BrSensor(coordinator, coord_prefix, description) for description in SENSOR_TYPES
+    )
 
 
-class BrSensor(SensorEntity):
+class BrSensor(CoordinatorEntity[BrDataUpdateCoordinator], SensorEntity):
     """Representation of a Buienradar sensor."""
 
     _attr_entity_registry_enabled_default = False
-    _attr_should_poll = False
     _attr_has_entity_name = True
 
     def __init__(
-        self, client_name, coordinates, description: SensorEntityDescription
+        self,
+        coordinator: BrDataUpdateCoordinator,
+        coord_prefix: str,
+        description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
+        super().__init__(coordinator)
         self.entity_description = description
-        self._measured = None
-        self._attr_unique_id = (
-            f"{coordinates[CONF_LATITUDE]:2.6f}{coordinates[CONF_LONGITUDE]:2.6f}"
-            f"{description.key}"
+        # The forecast day and base key are fixed per entity, so resolve
+        # the `_Nd` suffix once instead of on every update.
+        self._fcday = _FORECAST_DAYS.get(description.key[-3:])
+        self._base_key = (
+            description.key[:-3] if self._fcday is not None else description.key
         )
+        self._attr_unique_id = f"{coord_prefix}{description.key}"
 
         # All continuous sensors should be forced to be updated
         self._attr_force_update = (
             description.key != SYMBOL and not description.key.startswith(CONDITION)
         )
 
-        if description.key.startswith(PRECIPITATION_FORECAST):
-            self._timeframe = None
+        # Each entity extracts exactly one kind of value for its lifetime,
+        # so classify the key once here instead of on every data push.
+        key = description.key
+        if self._fcday is not None:
+            if key.startswith((SYMBOL, CONDITION)):
+                self._cond_field = _CONDITION_FIELDS[self._base_key]
+                self._kind = _SensorKind.FORECAST_CONDITION
+            elif key.startswith(WINDSPEED):
+                self._kind = _SensorKind.FORECAST_WINDSPEED
+            else:
+                self._kind = _SensorKind.FORECAST
+        elif key == SYMBOL or key.startswith(CONDITION):
+            self._cond_field = _CONDITION_FIELDS[key]
+            self._kind = _SensorKind.CONDITION
+        elif key.startswith(PRECIPITATION_FORECAST):
+            self._precip_key = key[len(PRECIPITATION_FORECAST) + 1 :]
+            self._kind = _SensorKind.PRECIPITATION_FORECAST
+        elif key in (WINDSPEED, WINDGUST):
+            self._kind = _SensorKind.WINDSPEED
+        elif key == VISIBILITY:
+            self._kind = _SensorKind.VISIBILITY
+        else:
+            self._kind = _SensorKind.OTHER
+
+    @property
+    def available(self) -> bool:
+        """Return True; sensors keep their last value when a refresh fails."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to coordinator updates and load the initial data."""
+        await super().async_added_to_hass()
+        if self.coordinator.last_update_success:
+            self._load_data(self.coordinator)
 
     @callback
-    def data_updated(self, data: BrData):
-        """Update data."""
-        if self._load_data(data.data) and self.hass:
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._load_data(self.coordinator):
             self.async_write_ha_state()
 
     @callback
-    def _load_data(self, data):  # noqa: C901
-        """Load the sensor with relevant data."""
-        # Find sensor
+    def _load_data(self, coordinator: BrDataUpdateCoordinator):
+        """Load the sensor with relevant data; return True if it changed."""
+        return self._HANDLERS[self._kind](self, coordinator)
 
-        # Check if we have a new measurement,
-        # otherwise we do not have to update the sensor
-        if self._measured == data.get(MEASURED):
+    def _forecast_available(self, forecast):
+        """Check that the forecast covers this sensor's day."""
+        if self._fcday < len(forecast):
+            return True
+        coordinator = self.coordinator
+        if not coordinator.missing_forecast_logged:
+            coordinator.missing_forecast_logged = True
+            _LOGGER.warning("No forecast for fcday=%s", self._fcday)
+        return False
+
+    def _update_forecast_condition(self, coordinator):
+        """Update a forecasted weather symbol or status text."""
+        forecast_days = coordinator.forecast_days
+        if not self._forecast_available(forecast_days):
             return False
 
-        self._measured = data.get(MEASURED)
-        sensor_type = self.entity_description.key
-
-        if sensor_type.endswith(("_1d", "_2d", "_3d", "_4d", "_5d")):
-            # update forecasting sensors:
-            fcday = 0
-            if sensor_type.endswith("_2d"):
-                fcday = 1
-            if sensor_type.endswith("_3d"):
-                fcday = 2
-            if sensor_type.endswith("_4d"):
-                fcday = 3
-            if sensor_type.endswith("_5d"):
-                fcday = 4
-
-            # update weather symbol & status text
-            if sensor_type.startswith((SYMBOL, CONDITION)):
-                try:
-                    condition = data.get(FORECAST)[fcday].get(CONDITION)
-                except IndexError:
-                    _LOGGER.warning("No forecast for fcday=%s", fcday)
-                    return False
-
-                if condition:
-                    new_state = condition.get(CONDITION)
-                    if sensor_type.startswith(SYMBOL):
-                        new_state = condition.get(EXACTNL)
-                    if sensor_type.startswith("conditioncode"):
-                        new_state = condition.get(CONDCODE)
-                    if sensor_type.startswith("conditiondetailed"):
-                        new_state = condition.get(DETAILED)
-                    if sensor_type.startswith("conditionexact"):
-                        new_state = condition.get(EXACT)
-
-                    img = condition.get(IMAGE)
-
-                    if new_state != self.state or img != self.entity_picture:
-                        self._attr_native_value = new_state
-                        self._attr_entity_picture = img
-                        return True
-                return False
-
-            if sensor_type.startswith(WINDSPEED):
-                # hass wants windspeeds in km/h not m/s, so convert:
-                try:
-                    self._attr_native_value = data.get(FORECAST)[fcday].get(
-                        sensor_type[:-3]
-                    )
-                except IndexError:
-                    _LOGGER.warning("No forecast for fcday=%s", fcday)
-                    return False
-
-                if self.state is not None:
-                    self._attr_native_value = round(self.state * 3.6, 1)
-                return True
+        condition = forecast_days[self._fcday].get(CONDITION)
+        if condition:
+            new_state = condition.get(self._cond_field)
+            img = condition.get(IMAGE)
 
-            # update all other sensors
-            try:
-                self._attr_native_value = data.get(FORECAST)[fcday].get(
-                    sensor_type[:-3]
-                )
-            except IndexError:
-                _LOGGER.warning("No forecast for fcday=%s", fcday)
-                return False
-            return True
+            if new_state != self._attr_native_value or img != self._attr_entity_picture:
+                self._attr_native_value = new_state
+                self._attr_entity_picture = img
+                return True
+        return False
 
-        if sensor_type == SYMBOL or sensor_type.startswith(CONDITION):
-            # update weather symbol & status text
-            if condition := data.get(CONDITION):
-                if sensor_type == SYMBOL:
-                    new_state = condition.get(EXACTNL)
-                if sensor_type == CONDITION:
-                    new_state = condition.get(CONDITION)
-                if sensor_type == "conditioncode":
-                    new_state = condition.get(CONDCODE)
-                if sensor_type == "conditiondetailed":
-                    new_state = condition.get(DETAILED)
-                if sensor_type == "conditionexact":
-                    new_state = condition.get(EXACT)
-
-                img = condition.get(IMAGE)
-
-                if new_state != self.state or img != self.entity_picture:
-                    self._attr_native_value = new_state
-                    self._attr_entity_picture = img
-                    return True
+    def _update_forecast_windspeed(self, coordinator):
+        """Update a forecasted windspeed, preconverted to km/h by the coordinator."""
+        forecast_wind_kmh = coordinator.forecast_wind_kmh
+        if not self._forecast_available(forecast_wind_kmh):
+            return False
+        self._attr_native_value = forecast_wind_kmh[self._fcday]
+        return True
 
+    def _update_forecast(self, coordinator):
+        """Update a forecasted value."""
+        forecast_days = coordinator.forecast_days
+        if not self._forecast_available(forecast_days):
             return False
+        self._attr_native_value = forecast_days[self._fcday].get(self._base_key)
+        return True
 
-        if sensor_type.startswith(PRECIPITATION_FORECAST):
-            # update nested precipitation forecast sensors
-            nested = data.get(PRECIPITATION_FORECAST)
-            self._timeframe = nested.get(TIMEFRAME)
-            self._attr_native_value = nested.get(
-                sensor_type[len(PRECIPITATION_FORECAST) + 1 :]
-            )
-            return True
+    def _update_condition(self, coordinator):
+        """Update the weather symbol or status text."""
+        if condition := coordinator.data.get(CONDITION):
+            new_state = condition.get(self._cond_field)
+            img = condition.get(IMAGE)
 
-        if sensor_type in [WINDSPEED, WINDGUST]:
-            # hass wants windspeeds in km/h not m/s, so convert:
-            self._attr_native_value = data.get(sensor_type)
-            if self.state is not None:
-                self._attr_native_value = round(data.get(sensor_type) * 3.6, 1)
-            return True
+            if new_state != self._attr_native_value or img != self._attr_entity_picture:
+                self._attr_native_value = new_state
+                self._attr_entity_picture = img
+                return True
 
-        if sensor_type == VISIBILITY:
-            # hass wants visibility in km (not m), so convert:
-            self._attr_native_value = data.get(sensor_type)
-            if self.state is not None:
-                self._attr_native_value = round(self.state / 1000, 1)
-            return True
+        return False
+
+    def _update_precipitation_forecast(self, coordinator):
+        """Update a nested precipitation forecast value."""
+        nested = coordinator.data.get(PRECIPITATION_FORECAST)
+        self._attr_native_value = nested.get(self._precip_key)
+        return True
+
+    def _update_windspeed(self, coordinator):
+        """Update the windspeed or wind gust, preconverted to km/h by the coordinator."""
+        self._attr_native_value = coordinator.wind_kmh.get(self._base_key)
+        return True
 
-        # update all other sensors
-        self._attr_native_value = data.get(sensor_type)
-        if sensor_type.startswith(PRECIPITATION_FORECAST):
-            result = {ATTR_ATTRIBUTION: data.get(ATTRIBUTION)}
-            if self._timeframe is not None:
-                result[TIMEFRAME_LABEL] = "%d min" % (self._timeframe)
-
-            self._attr_extra_state_attributes = result
-
-        result = {
-            ATTR_ATTRIBUTION: data.get(ATTRIBUTION),
-            STATIONNAME_LABEL: data.get(STATIONNAME),
-        }
-        if self._measured is not None:
-            # convert datetime (Europe/Amsterdam) into local datetime
-            local_dt = dt_util.as_local(self._measured)
-            result[MEASURED_LABEL] = local_dt.strftime("%c")
-
-        self._attr_extra_state_attributes = result
+    def _update_visibility(self, coordinator):
+        """Update the visibility, preconverted to km by the coordinator."""
+        visibility = coordinator.visibility_km
+        if visibility == self._attr_native_value:
+            # Visibility changes slowly; skip the state write when the
+            # rounded value is unchanged.
+            return False
+        self._attr_native_value = visibility
+        return True
+
+    def _update_other_sensors(self, coordinator):
+        """Update a plain measurement sensor."""
+        self._attr_native_value = coordinator.data.get(self._base_key)
+        self._attr_extra_state_attributes = coordinator.sensor_attrs
         return True
+
+    # Update handlers indexed by _SensorKind; dispatching an update is a
+    # single tuple index instead of a chain of key tests.
+    _HANDLERS = (
+        _update_forecast_condition,
+        _update_forecast_windspeed,
+        _update_forecast,
+        _update_condition,
+        _update_precipitation_forecast,
+        _update_windspeed,
+        _update_visibility,
+        _update_other_sensors,
+    )
@@ -1,7 +1,7 @@
 """Shared utilities for different supported platforms."""
 
 from asyncio import timeout
-from datetime import datetime, timedelta
+from datetime import timedelta
 from http import HTTPStatus
 import logging
 
@@ -14,6 +14,7 @@ from buienradar.constants import (
     DATA,
     FORECAST,
     HUMIDITY,
+    MEASURED,
     MESSAGE,
     PRESSURE,
     STATIONNAME,
@@ -22,69 +23,53 @@ from buienradar.constants import (
     TEMPERATURE,
     VISIBILITY,
     WINDAZIMUTH,
+    WINDGUST,
     WINDSPEED,
 )
 from buienradar.urls import JSON_FEED_URL, json_precipitation_forecast_url
 
-from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
-from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.const import ATTR_ATTRIBUTION, CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .const import SCHEDULE_NOK, SCHEDULE_OK
+from .const import DOMAIN, MEASURED_LABEL, SCHEDULE_NOK, SCHEDULE_OK, STATIONNAME_LABEL
 
-__all__ = ["BrData"]
+__all__ = ["BrDataUpdateCoordinator"]
 _LOGGER = logging.getLogger(__name__)
 
-"""
-Log at WARN level after WARN_THRESHOLD failures, otherwise log at
-DEBUG level.
-"""
-WARN_THRESHOLD = 4
 
+class BrDataUpdateCoordinator(DataUpdateCoordinator[dict]):
+    """Get the latest data from buienradar and derive the shared values."""
 
-def threshold_log(count: int, *args, **kwargs) -> None:
-    """Log at warn level after WARN_THRESHOLD failures, debug otherwise."""
-    if count >= WARN_THRESHOLD:
-        _LOGGER.warning(*args, **kwargs)
-    else:
-        _LOGGER.debug(*args, **kwargs)
-
-
-class BrData:
-    """Get the latest data and updates the states."""
-
-    # Initialize to warn immediately if the first call fails.
-    load_error_count: int = WARN_THRESHOLD
-    rain_error_count: int = WARN_THRESHOLD
-
-    def __init__(self, hass, coordinates, timeframe, devices):
-        """Initialize the data object."""
-        self.devices = devices
-        self.data = {}
-        self.hass = hass
+    def __init__(self, hass: HomeAssistant, coordinates, timeframe) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(minutes=SCHEDULE_OK),
+            # An unchanged payload cannot change any entity state, so only
+            # notify the entities when new data actually arrived.
+            always_update=False,
+        )
+        # Start with an empty payload so the properties below never have
+        # to guard against a missing first refresh.
+        self.data: dict = {}
         self.coordinates = coordinates
         self.timeframe = timeframe
-        self.unsub_schedule_update: CALLBACK_TYPE | None = None
-
-    async def update_devices(self):
-        """Update all devices/sensors."""
-        if not self.devices:
-            return
-
-        # Update all devices
-        for dev in self.devices:
-            dev.data_updated(self)
-
-    @callback
-    def async_schedule_update(self, minute=1):
-        """Schedule an update after minute minutes."""
-        _LOGGER.debug("Scheduling next update in %s minutes", minute)
-        nxt = dt_util.utcnow() + timedelta(minutes=minute)
-        self.unsub_schedule_update = async_track_point_in_utc_time(
-            self.hass, self.async_update, nxt
-        )
+        self.forecast_days: list = []
+        self.wind_kmh: dict = {}
+        self.forecast_wind_kmh: list = []
+        self.visibility_km: float | None = None
+        self.last_measured = None
+        self.measured_formatted: str | None = None
+        self.sensor_attrs: dict = {}
+        # Set by the first forecast sensor that finds its day missing and
+        # re-armed below once the feed covers all five days again, so a
+        # short forecast list is warned about once per streak.
+        self.missing_forecast_logged = False
 
     async def get_data(self, url):
         """Load data from specified url."""
@@ -111,21 +96,15 @@ class BrData:
             if resp is not None:
                 resp.release()
 
-    async def _async_update(self):
-        """Update the data from buienradar."""
+    async def _fetch_data(self) -> dict:
+        """Fetch and parse the buienradar feeds."""
         content = await self.get_data(JSON_FEED_URL)
 
         if content.get(SUCCESS) is not True:
-            # unable to get the data
-            self.load_error_count += 1
-            threshold_log(
-                self.load_error_count,
-                "Unable to retrieve json data from Buienradar (Msg: %s, status: %s)",
-                content.get(MESSAGE),
-                content.get(STATUS_CODE),
+            raise UpdateFailed(
+                f"Unable to retrieve json data from Buienradar "
+                f"(Msg: {content.get(MESSAGE)}, status: {content.get(STATUS_CODE)})"
             )
-            return None
-        self.load_error_count = 0
 
         # rounding coordinates prevents unnecessary redirects/calls
         lat = self.coordinates[CONF_LATITUDE]
@@ -134,48 +113,86 @@ class BrData:
         raincontent = await self.get_data(rainurl)
 
         if raincontent.get(SUCCESS) is not True:
-            self.rain_error_count += 1
-            # unable to get the data
-            threshold_log(
-                self.rain_error_count,
-                "Unable to retrieve rain data from Buienradar (Msg: %s, status: %s)",
-                raincontent.get(MESSAGE),
-                raincontent.get(STATUS_CODE),
+            raise UpdateFailed(
+                f"Unable to retrieve rain data from Buienradar "
+                f"(Msg: {raincontent.get(MESSAGE)}, "
+                f"status: {raincontent.get(STATUS_CODE)})"
             )
-            return None
-        self.rain_error_count = 0
 
         result = parse_data(
             content.get(CONTENT),
             raincontent.get(CONTENT),
-            self.coordinates[CONF_LATITUDE],
-            self.coordinates[CONF_LONGITUDE],
+            lat,
+            lon,
             self.timeframe,
             False,
         )
 
         _LOGGER.debug("Buienradar parsed data: %s", result)
         if result.get(SUCCESS) is not True:
-            if int(datetime.now().strftime("%H")) > 0:
-                _LOGGER.warning(
-                    "Unable to parse data from Buienradar. (Msg: %s)",
-                    result.get(MESSAGE),
-                )
-            return None
+            raise UpdateFailed(
+                f"Unable to parse data from Buienradar (Msg: {result.get(MESSAGE)})"
+            )
 
         return result[DATA]
 
-    async def async_update(self, *_):
-        """Update the data from buienradar and schedule the next update."""
-        data = await self._async_update()
+    async def _async_update_data(self) -> dict:
+        """Update the data from buienradar and derive the shared values."""
+        try:
+            data = await self._fetch_data()
+        except UpdateFailed:
+            # Retry sooner while buienradar cannot be reached or parsed.
+            self.update_interval = timedelta(minutes=SCHEDULE_NOK)
+            raise
+        self.update_interval = timedelta(minutes=SCHEDULE_OK)
+
+        # The forecast list is shared by every forecast entity; resolve it
+        # once per refresh instead of once per entity update.
+        self.forecast_days = data.get(FORECAST) or []
+        # The sensors expose five forecast days; only re-arm the
+        # short-forecast warning when all of them are covered again.
+        if len(self.forecast_days) >= 5:
+            self.missing_forecast_logged = False
+
+        # hass wants windspeeds in km/h not m/s; convert all wind fields
+        # once per refresh instead of in every wind sensor update.
+        self.wind_kmh = {
+            key: round(value * 3.6, 1)
+            for key in (WINDSPEED, WINDGUST)
+            if (value := data.get(key)) is not None
+        }
+        self.forecast_wind_kmh = [
+            round(value * 3.6, 1) if (value := day.get(WINDSPEED)) is not None else None
+            for day in self.forecast_days
+        ]
+
+        # hass wants visibility in km, the feed reports meters.
+        self.visibility_km = (
+            round(value * 0.001, 1)
+            if (value := data.get(VISIBILITY)) is not None
+            else None
+        )
 
-        if data is None:
-            self.async_schedule_update(SCHEDULE_NOK)
-            return
+        self.last_measured = data.get(MEASURED)
+        # Locale-aware strftime is comparatively heavy; format the
+        # measurement time once per refresh instead of in every sensor that
+        # exposes it as an attribute.
+        self.measured_formatted = (
+            # convert datetime (Europe/Amsterdam) into local datetime
+            dt_util.as_local(self.last_measured).strftime("%c")
+            if self.last_measured is not None
+            else None
+        )
 
-        self.data = data
-        await self.update_devices()
-        self.async_schedule_update(SCHEDULE_OK)
+        # The extra state attributes are identical for every plain
+        # measurement sensor; build the dict once per refresh.
+        self.sensor_attrs = {
+            ATTR_ATTRIBUTION: data.get(ATTRIBUTION),
+            STATIONNAME_LABEL: data.get(STATIONNAME),
+        }
+        if self.measured_formatted is not None:
+            self.sensor_attrs[MEASURED_LABEL] = self.measured_formatted
+        return data
 
     @property
     def attribution(self):
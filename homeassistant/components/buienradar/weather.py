@@ -53,10 +53,11 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 # Reuse data and API logic from the sensor implementation
 from .const import DEFAULT_TIMEFRAME, DOMAIN
-from .util import BrData
+from .util import BrDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -107,19 +108,17 @@ async def async_setup_entry(
 
     coordinates = {CONF_LATITUDE: float(latitude), CONF_LONGITUDE: float(longitude)}
 
-    # create weather entity:
-    _LOGGER.debug("Initializing buienradar weather: coordinates %s", coordinates)
-    entities = [BrWeather(config, coordinates)]
-
     # create weather data:
-    data = BrData(hass, coordinates, DEFAULT_TIMEFRAME, entities)
-    hass.data[DOMAIN][entry.entry_id][Platform.WEATHER] = data
-    await data.async_update()
+    _LOGGER.debug("Initializing buienradar weather: coordinates %s", coordinates)
+    coordinator = BrDataUpdateCoordinator(hass, coordinates, DEFAULT_TIMEFRAME)
+    hass.data[DOMAIN][entry.entry_id][Platform.WEATHER] = coordinator
+    await coordinator.async_refresh()
 
-    async_add_entities(entities)
+    # create weather entity:
+    async_add_entities([BrWeather(coordinator, config, coordinates)])
 
 
-class BrWeather(WeatherEntity):
+class BrWeather(CoordinatorEntity[BrDataUpdateCoordinator], WeatherEntity):
     """Representation of a weather condition."""
 
     _attr_native_precipitation_unit = UnitOfPrecipitationDepth.MILLIMETERS
@@ -127,11 +126,11 @@ class BrWeather(WeatherEntity):
     _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_native_visibility_unit = UnitOfLength.METERS
     _attr_native_wind_speed_unit = UnitOfSpeed.METERS_PER_SECOND
-    _attr_should_poll = False
     _attr_supported_features = WeatherEntityFeature.FORECAST_DAILY
 
-    def __init__(self, config, coordinates):
+    def __init__(self, coordinator: BrDataUpdateCoordinator, config, coordinates):
         """Initialize the platform with a data instance and station name."""
+        super().__init__(coordinator)
         self._stationname = config.get(CONF_NAME, "Buienradar")
         self._attr_name = self._stationname or f"BR {'(unknown station)'}"
 
@@ -140,9 +139,31 @@ class BrWeather(WeatherEntity):
         )
         self._forecast: list | None = None
 
+    @property
+    def available(self) -> bool:
+        """Return True; the entity keeps its last state when a refresh fails."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to coordinator updates and load the initial data."""
+        await super().async_added_to_hass()
+        if self.coordinator.last_update_success:
+            self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+        assert self.platform.config_entry
+        self.platform.config_entry.async_create_task(
+            self.hass, self.async_update_listeners(("daily",))
+        )
+
     @callback
-    def data_updated(self, data: BrData) -> None:
-        """Update data."""
+    def _update_from_coordinator(self) -> None:
+        """Update the entity state from the coordinator data."""
+        data = self.coordinator
         self._attr_attribution = data.attribution
         self._attr_condition = self._calc_condition(data)
         self._forecast = self._calc_forecast(data)
@@ -156,21 +177,13 @@ class BrWeather(WeatherEntity):
         self._attr_native_wind_speed = data.wind_speed
         self._attr_wind_bearing = data.wind_bearing
 
-        if not self.hass:
-            return
-        self.async_write_ha_state()
-        assert self.platform.config_entry
-        self.platform.config_entry.async_create_task(
-            self.hass, self.async_update_listeners(("daily",))
-        )
-
-    def _calc_condition(self, data: BrData):
+    def _calc_condition(self, data: BrDataUpdateCoordinator):
         """Return the current condition."""
         if data.condition and (ccode := data.condition.get(CONDCODE)):
             return CONDITION_MAP.get(ccode)
         return None
 
-    def _calc_forecast(self, data: BrData):
+    def _calc_forecast(self, data: BrDataUpdateCoordinator):
         """Return the forecast array."""
         fcdata_out = []
 
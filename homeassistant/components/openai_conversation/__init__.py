@@ -19,6 +19,7 @@ from homeassistant.exceptions import (
     ServiceValidationError,
 )
 from homeassistant.helpers import config_validation as cv, selector
+from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN, LOGGER
@@ -88,9 +89,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: OpenAIConfigEntry) -> bool:
     """Set up OpenAI Conversation from a config entry."""
-    client = openai.AsyncOpenAI(api_key=entry.data[CONF_API_KEY])
+    # Reuse the shared httpx client so the connection pool set up during the
+    # config flow is reused instead of building a new one per entry.
+    client = openai.AsyncOpenAI(
+        api_key=entry.data[CONF_API_KEY], http_client=get_async_client(hass)
+    )
     try:
-        await hass.async_add_executor_job(client.with_options(timeout=10.0).models.list)
+        await client.with_options(timeout=10.0).models.list()
     except openai.AuthenticationError as err:
         LOGGER.error("Invalid API key: %s", err)
         return False
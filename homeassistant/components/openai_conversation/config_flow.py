@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
 from types import MappingProxyType
 from typing import Any
@@ -18,6 +19,7 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_API_KEY, CONF_LLM_HASS_API
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import llm
+from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
@@ -49,20 +51,34 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
-RECOMMENDED_OPTIONS = {
-    CONF_RECOMMENDED: True,
-    CONF_LLM_HASS_API: llm.LLM_API_ASSIST,
-    CONF_PROMPT: llm.DEFAULT_INSTRUCTIONS_PROMPT,
-}
+RECOMMENDED_OPTIONS = MappingProxyType(
+    {
+        CONF_RECOMMENDED: True,
+        CONF_LLM_HASS_API: llm.LLM_API_ASSIST,
+        CONF_PROMPT: llm.DEFAULT_INSTRUCTIONS_PROMPT,
+    }
+)
 
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> None:
+async def validate_input(hass: HomeAssistant, data: Mapping[str, Any]) -> None:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    client = openai.AsyncOpenAI(api_key=data[CONF_API_KEY])
-    await hass.async_add_executor_job(client.with_options(timeout=10.0).models.list)
+    # Reuse the shared httpx client so the connection pool and TLS session
+    # survive across config-flow steps.
+    # The client only lives for this probe, so set the timeout at
+    # construction instead of copying the client with with_options.
+    # The client retries transient failures (429, 5xx, timeouts) with
+    # exponential backoff before an error reaches the flow, so the user
+    # is not bounced back to the form on a single flaky request.
+    client = openai.AsyncOpenAI(
+        api_key=data[CONF_API_KEY],
+        http_client=get_async_client(hass),
+        timeout=10.0,
+        max_retries=2,
+    )
+    await client.models.list()
 
 
 class OpenAIConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -118,6 +134,7 @@ class OpenAIOptionsFlow(OptionsFlow):
         self.last_rendered_recommended = config_entry.options.get(
             CONF_RECOMMENDED, False
         )
+        self._hass_apis: list[SelectOptionDict] | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -140,7 +157,24 @@ class OpenAIOptionsFlow(OptionsFlow):
                 CONF_LLM_HASS_API: user_input[CONF_LLM_HASS_API],
             }
 
-        schema = openai_config_option_schema(self.hass, options)
+        if self._hass_apis is None:
+            # The LLM API registry does not change while the dialog is open;
+            # build the selector options once per flow instead of per render.
+            self._hass_apis = [
+                SelectOptionDict(
+                    label="No control",
+                    value="none",
+                )
+            ]
+            self._hass_apis.extend(
+                SelectOptionDict(
+                    label=api.name,
+                    value=api.id,
+                )
+                for api in llm.async_get_apis(self.hass)
+            )
+
+        schema = openai_config_option_schema(options, self._hass_apis)
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(schema),
@@ -148,24 +182,10 @@ class OpenAIOptionsFlow(OptionsFlow):
 
 
 def openai_config_option_schema(
-    hass: HomeAssistant,
     options: dict[str, Any] | MappingProxyType[str, Any],
+    hass_apis: list[SelectOptionDict],
 ) -> dict:
     """Return a schema for OpenAI completion options."""
-    hass_apis: list[SelectOptionDict] = [
-        SelectOptionDict(
-            label="No control",
-            value="none",
-        )
-    ]
-    hass_apis.extend(
-        SelectOptionDict(
-            label=api.name,
-            value=api.id,
-        )
-        for api in llm.async_get_apis(hass)
-    )
-
     schema = {
         vol.Optional(
             CONF_PROMPT,
@@ -188,28 +208,26 @@ def openai_config_option_schema(
     if options.get(CONF_RECOMMENDED):
         return schema
 
-    schema.update(
-        {
-            vol.Optional(
-                CONF_CHAT_MODEL,
-                description={"suggested_value": options.get(CONF_CHAT_MODEL)},
-                default=RECOMMENDED_CHAT_MODEL,
-            ): str,
-            vol.Optional(
-                CONF_MAX_TOKENS,
-                description={"suggested_value": options.get(CONF_MAX_TOKENS)},
-                default=RECOMMENDED_MAX_TOKENS,
-            ): int,
-            vol.Optional(
-                CONF_TOP_P,
-                description={"suggested_value": options.get(CONF_TOP_P)},
-                default=RECOMMENDED_TOP_P,
-            ): NumberSelector(NumberSelectorConfig(min=0, max=1, step=0.05)),
-            vol.Optional(
-                CONF_TEMPERATURE,
-                description={"suggested_value": options.get(CONF_TEMPERATURE)},
-                default=RECOMMENDED_TEMPERATURE,
-            ): NumberSelector(NumberSelectorConfig(min=0, max=2, step=0.05)),
-        }
-    )
-    return schema
+    return {
+        **schema,
+        vol.Optional(
+            CONF_CHAT_MODEL,
+            description={"suggested_value": options.get(CONF_CHAT_MODEL)},
+            default=RECOMMENDED_CHAT_MODEL,
+        ): str,
+        vol.Optional(
+            CONF_MAX_TOKENS,
+            description={"suggested_value": options.get(CONF_MAX_TOKENS)},
+            default=RECOMMENDED_MAX_TOKENS,
+        ): int,
+        vol.Optional(
+            CONF_TOP_P,
+            description={"suggested_value": options.get(CONF_TOP_P)},
+            default=RECOMMENDED_TOP_P,
+        ): NumberSelector(NumberSelectorConfig(min=0, max=1, step=0.05)),
+        vol.Optional(
+            CONF_TEMPERATURE,
+            description={"suggested_value": options.get(CONF_TEMPERATURE)},
+            default=RECOMMENDED_TEMPERATURE,
+        ): NumberSelector(NumberSelectorConfig(min=0, max=2, step=0.05)),
+    }
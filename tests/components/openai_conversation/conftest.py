@@ -1,6 +1,7 @@
 """Tests helpers."""
 
-from unittest.mock import patch
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -40,13 +41,16 @@ def mock_config_entry_with_assist(
 @pytest.fixture
 async def mock_init_component(
     hass: HomeAssistant, mock_config_entry: MockConfigEntry
-) -> None:
+) -> AsyncGenerator[None]:
     """Initialize integration."""
     with patch(
         "openai.resources.models.AsyncModels.list",
+        new_callable=AsyncMock,
     ):
         assert await async_setup_component(hass, "openai_conversation", {})
         await hass.async_block_till_done()
+        # Keep the models.list probe mocked so tests can reload the entry.
+        yield
 
 
 @pytest.fixture(autouse=True)
@@ -1,6 +1,6 @@
 """Test the OpenAI Conversation config flow."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from httpx import Response
 from openai import APIConnectionError, AuthenticationError, BadRequestError
@@ -45,6 +45,7 @@ async def test_form(hass: HomeAssistant) -> None:
     with (
         patch(
             "homeassistant.components.openai_conversation.config_flow.openai.resources.models.AsyncModels.list",
+            new_callable=AsyncMock,
         ),
         patch(
             "homeassistant.components.openai_conversation.async_setup_entry",
@@ -114,6 +115,7 @@ async def test_form_invalid_auth(hass: HomeAssistant, side_effect, error) -> Non
 
     with patch(
         "homeassistant.components.openai_conversation.config_flow.openai.resources.models.AsyncModels.list",
+        new_callable=AsyncMock,
         side_effect=side_effect,
     ):
         result2 = await hass.config_entries.flow.async_configure(
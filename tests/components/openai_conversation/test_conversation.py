@@ -86,6 +86,7 @@ async def test_template_error(
     with (
         patch(
             "openai.resources.models.AsyncModels.list",
+            new_callable=AsyncMock,
         ),
         patch(
             "openai.resources.chat.completions.AsyncCompletions.create",
@@ -123,6 +124,7 @@ async def test_template_variables(
     with (
         patch(
             "openai.resources.models.AsyncModels.list",
+            new_callable=AsyncMock,
         ),
         patch(
             "openai.resources.chat.completions.AsyncCompletions.create",
@@ -1,6 +1,6 @@
 """Tests for the OpenAI integration."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from httpx import Response
 from openai import (
@@ -183,6 +183,7 @@ async def test_init_error(
     """Test initialization errors."""
     with patch(
         "openai.resources.models.AsyncModels.list",
+        new_callable=AsyncMock,
         side_effect=side_effect,
     ):
         assert await async_setup_component(hass, "openai_conversation", {})